@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+JSONDecodeError = json.JSONDecodeError
+
+# orjson only keeps integers within the 64-bit range exact and silently turns
+# wider ones into floats. A run of 19 digits already reaches past the signed
+# range, so such payloads are left to the stdlib parser. Digits are folded to
+# "0" and token separators to "," so the scan is a single substring search,
+# and digits following "." or "e" (fractions, exponents) are not counted.
+_WIDE_INT_SCAN = bytes.maketrans(b"0123456789 \t\n\r[:,-", b"0" * 10 + b"," * 8)
+_WIDE_INT_RUN = b"0" * 19
+
+
+def _has_wide_int(data: bytes | str) -> bool:
+    if isinstance(data, str):
+        data = data.encode("utf-8", "surrogatepass")
+    folded = data.translate(_WIDE_INT_SCAN)
+    return b"," + _WIDE_INT_RUN in folded or folded.startswith(_WIDE_INT_RUN)
+
+class _NonFiniteFloat(float):
+    """NaN/Infinity parsed by the stdlib.
+
+    orjson refuses float subclasses, so ``dumps`` hands these to the stdlib,
+    which writes them back as ``NaN``/``Infinity`` instead of ``null``.
+    """
+
+    __slots__ = ()
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 encoded JSON bytes.
+
+    Uses orjson when it is installed and falls back to the stdlib otherwise,
+    or for values orjson cannot represent (integers beyond 64 bits, NaN).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+    ).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from ``bytes`` or ``str``.
+
+    Payloads with very wide integers or NaN/Infinity are parsed by the stdlib
+    so that no value is rounded or rejected.
+    """
+    if orjson is not None:
+        if not _has_wide_int(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # Retried below; the stdlib also accepts NaN/Infinity
+                pass
+    if not isinstance(data, str):
+        # Strict UTF-8 like orjson: no BOM stripping or UTF-16/32 detection
+        try:
+            data = str(data, "utf-8")
+        except UnicodeDecodeError as e:
+            raise JSONDecodeError(f"Invalid UTF-8: {e.reason}", "", e.start) from e
+    return json.loads(data, parse_constant=_NonFiniteFloat)
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
 import argparse
-import json
+import logging
+import multiprocessing
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 from tqdm import tqdm
 
+from ._json import dumps, loads
 from .config import ensure_artifacts_dir, load_config
-from .diffing import compare_bodies, compare_headers, compare_status
-from .http_client import prepare_headers, send_request
+from .diffing import bodies_identical, compare_bodies, compare_headers_lowered, compare_status, diff_json_bodies
+from .http_client import configure_pools, prepare_headers, sanitize_headers, send_request
 from .logs import extract_testcases, load_logs
 from .report import render_html
 
@@ -32,7 +40,31 @@ def _find_default_logs() -> str:
 
 
 def _default_testcases_path() -> str:
-    return "artifacts/testcases.json"
+    return "artifacts/testcases.jsonl"
+
+
+def _write_testcases(path: Path, cases: List[Dict[str, Any]]) -> None:
+    """Write testcases as JSON Lines, one case per line."""
+    with path.open("wb") as f:
+        for c in cases:
+            f.write(dumps(c))
+            f.write(b"\n")
+
+
+def _iter_testcases(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream testcases from a JSON Lines file.
+
+    Files holding a single JSON array (the previous format) are still accepted.
+    """
+    with path.open("rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith(b"["):
+                yield from loads(line + f.read())
+                return
+            yield loads(line)
 
 
 def cmd_extract(args: argparse.Namespace) -> int:
@@ -42,48 +74,153 @@ def cmd_extract(args: argparse.Namespace) -> int:
     cases = extract_testcases(logs, cfg)
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(cases, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_testcases(out_path, cases)
     print(f"Wrote {len(cases)} testcases to {out_path}")
     return 0
 
 
-def _run_case(case: Dict[str, Any], cfg: Dict[str, Any]) -> Dict[str, Any]:
+@dataclass(frozen=True)
+class RunCtx:
+    """Per-run settings resolved once from the config and shared by all cases."""
+
+    left_name: str
+    right_name: str
+    left_base: str
+    right_base: str
+    left_defaults: Dict[str, str]
+    right_defaults: Dict[str, str]
+    timeout: float
+    verify: bool
+    resp_ignore_headers: FrozenSet[str]
+    resp_ignore_body_paths: FrozenSet[str]
+    fanout: Optional[Executor] = None
+    diff_pool: Optional[Executor] = None
+
+
+def _build_run_ctx(
+    cfg: Dict[str, Any],
+    fanout: Optional[Executor] = None,
+    diff_pool: Optional[Executor] = None,
+) -> RunCtx:
     targets = cfg["targets"]
     exec_cfg = cfg.get("execution", {})
-    
+    resp_ign = cfg.get("response_ignores", {})
+    return RunCtx(
+        left_name=targets["left"].get("name", "left"),
+        right_name=targets["right"].get("name", "right"),
+        left_base=targets["left"]["base_url"],
+        right_base=targets["right"]["base_url"],
+        left_defaults=sanitize_headers(targets["left"].get("default_headers", {})),
+        right_defaults=sanitize_headers(targets["right"].get("default_headers", {})),
+        timeout=exec_cfg.get("timeout_seconds", 20),
+        verify=exec_cfg.get("verify_tls", True),
+        resp_ignore_headers=frozenset(k.lower() for k in resp_ign.get("headers", [])),
+        resp_ignore_body_paths=frozenset(resp_ign.get("body_json_paths", []) or []),
+        fanout=fanout,
+        diff_pool=diff_pool,
+    )
+
+
+def _diff_mp_context() -> multiprocessing.context.BaseContext:
+    # forkserver children start from a clean server process instead of
+    # forking the threaded runner; it is unavailable on Windows
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+class _ResultSpool:
+    """Completed results spooled to a temporary file instead of held in memory.
+
+    Results are added in completion order and read back ordered by id.
+    """
+
+    def __init__(self) -> None:
+        self._file = tempfile.TemporaryFile()
+        self._index: List[Tuple[Any, int, int]] = []
+        self._size = 0
+        self.passed = 0
+        self.failed = 0
+
+    def __enter__(self) -> "_ResultSpool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._file.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add(self, result: Dict[str, Any]) -> None:
+        data = dumps(result, indent=True)
+        self._file.write(data)
+        self._index.append((result["id"], self._size, len(data)))
+        self._size += len(data)
+        if result.get("compare", {}).get("equal"):
+            self.passed += 1
+        else:
+            self.failed += 1
+
+    def iter_raw(self) -> Iterator[bytes]:
+        """Yield each serialized result, ordered by id."""
+        self._index.sort(key=itemgetter(0))  # restore order
+        for _, offset, size in self._index:
+            self._file.seek(offset)
+            yield self._file.read(size)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for raw in self.iter_raw():
+            yield loads(raw)
+
+
+def _run_case(case: Dict[str, Any], ctx: RunCtx) -> Dict[str, Any]:
     # Handle path-grouped test cases
     if case.get("type") == "path_group":
-        return _run_path_group_case(case, cfg)
+        return _run_path_group_case(case, ctx)
     
     # Original single test case logic
-    left = send_request(
-        base_url=targets["left"]["base_url"],
-        method=case["method"],
-        path=case["path"],
-        query=case.get("query", {}),
-        headers=case.get("headers", {}),
-        body=case.get("body"),
-        timeout_seconds=exec_cfg.get("timeout_seconds", 20),
-        verify_tls=exec_cfg.get("verify_tls", True),
-    )
-    right = send_request(
-        base_url=targets["right"]["base_url"],
+    case_headers = case.get("headers", {})
+    request_kwargs = dict(
         method=case["method"],
         path=case["path"],
         query=case.get("query", {}),
-        headers=case.get("headers", {}),
         body=case.get("body"),
-        timeout_seconds=exec_cfg.get("timeout_seconds", 20),
-        verify_tls=exec_cfg.get("verify_tls", True),
+        timeout_seconds=ctx.timeout,
+        verify_tls=ctx.verify,
     )
+    # Sanitize the case headers once and share them between both targets
+    request_headers = sanitize_headers(case_headers)
+    left_headers = prepare_headers(ctx.left_defaults, request_headers)
+    right_headers = prepare_headers(ctx.right_defaults, request_headers)
+    if ctx.fanout is None:
+        left = send_request(base_url=ctx.left_base, headers=left_headers, **request_kwargs)
+        right = send_request(base_url=ctx.right_base, headers=right_headers, **request_kwargs)
+    else:
+        # Both sides are independent I/O; the right side goes to the fan-out
+        # pool while this worker thread sends the left request itself
+        f_right = ctx.fanout.submit(
+            send_request, base_url=ctx.right_base, headers=right_headers, **request_kwargs
+        )
+        left = send_request(base_url=ctx.left_base, headers=left_headers, **request_kwargs)
+        right = f_right.result()
 
-    resp_ign = cfg.get("response_ignores", {})
     status_cmp = compare_status(left["status"], right["status"])
-    headers_cmp = compare_headers(left["headers"], right["headers"], resp_ign.get("headers", []))
+    headers_cmp = compare_headers_lowered(left["headers"], right["headers"], ctx.resp_ignore_headers)
 
     left_body = left.get("body_json") if left.get("body_json") is not None else left.get("body_text")
     right_body = right.get("body_json") if right.get("body_json") is not None else right.get("body_text")
-    bodies_cmp = compare_bodies(left_body, right_body, resp_ign.get("body_json_paths", []))
+    if (
+        ctx.diff_pool is not None
+        and isinstance(left_body, (dict, list))
+        and isinstance(right_body, (dict, list))
+        and not bodies_identical(left_body, right_body)
+    ):
+        # DeepDiff is CPU-bound; run it outside this process to sidestep the GIL
+        bodies_cmp = ctx.diff_pool.submit(
+            diff_json_bodies, left_body, right_body, ctx.resp_ignore_body_paths
+        ).result()
+    else:
+        bodies_cmp = compare_bodies(left_body, right_body, ctx.resp_ignore_body_paths)
 
     equal = status_cmp["equal"] and headers_cmp["equal"] and bodies_cmp["equal"]
 
@@ -94,11 +231,11 @@ def _run_case(case: Dict[str, Any], cfg: Dict[str, Any]) -> Dict[str, Any]:
             "method": case["method"],
             "path": case["path"],
             "query": case.get("query", {}),
-            "headers": case.get("headers", {}),
+            "headers": case_headers,
             "body": case.get("body"),
         },
-        "left": {**left, "target": targets["left"]["name"]},
-        "right": {**right, "target": targets["right"]["name"]},
+        "left": {**left, "target": ctx.left_name},
+        "right": {**right, "target": ctx.right_name},
         "compare": {
             "status": status_cmp,
             "headers": headers_cmp,
@@ -108,15 +245,12 @@ def _run_case(case: Dict[str, Any], cfg: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _run_path_group_case(case: Dict[str, Any], cfg: Dict[str, Any]) -> Dict[str, Any]:
+def _run_path_group_case(case: Dict[str, Any], ctx: RunCtx) -> Dict[str, Any]:
     """Run a path-grouped test case with all its parameter combinations."""
-    targets = cfg["targets"]
-    exec_cfg = cfg.get("execution", {})
-    
     # Run all sub-cases for parameter combinations (these contain the actual request bodies)
     sub_results = []
     for sub_case in case.get("sub_cases", []):
-        sub_result = _run_case(sub_case, cfg)
+        sub_result = _run_case(sub_case, ctx)
         sub_results.append(sub_result)
     
     # Aggregate results
@@ -149,8 +283,8 @@ def cmd_run(args: argparse.Namespace) -> int:
         cases = extract_testcases(logs, cfg)
         if args.max and args.max > 0:
             cases = cases[: args.max]
-        tmp_cases = artifacts / "testcases.json"
-        tmp_cases.write_text(json.dumps(cases, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp_cases = artifacts / "testcases.jsonl"
+        _write_testcases(tmp_cases, cases)
     else:
         cases_path_str = args.testcases or _default_testcases_path()
         cases_path = Path(cases_path_str)
@@ -158,31 +292,14 @@ def cmd_run(args: argparse.Namespace) -> int:
             raise FileNotFoundError(
                 f"Testcases file not found: {cases_path}. Use --refresh-from-logs or run 'compare-api extract' first."
             )
-        cases = json.loads(cases_path.read_text(encoding="utf-8"))
+        # Parsed lazily: cases are submitted while the file is still being read
+        cases = _iter_testcases(cases_path)
     if args.max and args.max > 0:
-        cases = cases[: args.max]
+        cases = islice(cases, args.max)
 
-    results: List[Dict[str, Any]] = []
-    with ThreadPoolExecutor(max_workers=cfg.get("execution", {}).get("concurrency", 8)) as ex:
-        futures = {ex.submit(_run_case, c, cfg): c for c in cases}
-        for fut in tqdm(as_completed(futures), total=len(futures), desc="Running"):
-            try:
-                results.append(fut.result())
-            except Exception as e:
-                c = futures[fut]
-                results.append({
-                    "id": c["id"],
-                    "error": str(e),
-                    "request": c,
-                    "compare": {"equal": False},
-                })
-
-    results.sort(key=lambda r: r["id"])  # restore order
-    summary = {
-        "total": len(results),
-        "passed": sum(1 for r in results if r.get("compare", {}).get("equal")),
-        "failed": sum(1 for r in results if not r.get("compare", {}).get("equal")),
-    }
+    configure_pools(cfg)
+    concurrency = cfg.get("execution", {}).get("concurrency", 8)
+    diff_processes = cfg.get("execution", {}).get("diff_processes", 0) or 0
     targets_info = {
         "left": {
             "name": cfg["targets"]["left"].get("name", "left"),
@@ -193,15 +310,53 @@ def cmd_run(args: argparse.Namespace) -> int:
             "base_url": cfg["targets"]["right"].get("base_url", "")
         },
     }
-
-    # Write machine-readable results
     results_json_path = artifacts / "results.json"
-    json_payload = {"summary": summary, "results": results, "targets": targets_info}
-    results_json_path.write_text(json.dumps(json_payload, ensure_ascii=False, indent=2), encoding="utf-8")
-
-    # Render HTML
     html_path = artifacts / "report.html"
-    render_html({"summary": summary, "results": results, "targets": targets_info}, html_path)
+
+    with _ResultSpool() as results:
+        # Case-level parallelism in ``ex``; ``fanout`` sends each case's right
+        # request alongside the left one, so at most 2 x concurrency requests
+        # (concurrency per target) are in flight.
+        with ExitStack() as stack:
+            fanout = stack.enter_context(ThreadPoolExecutor(max_workers=concurrency))
+            diff_pool = None
+            if diff_processes > 0:
+                diff_pool = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=diff_processes, mp_context=_diff_mp_context())
+                )
+            ex = stack.enter_context(ThreadPoolExecutor(max_workers=concurrency))
+            run_case = partial(_run_case, ctx=_build_run_ctx(cfg, fanout, diff_pool))
+            futures = {ex.submit(run_case, c): c for c in cases}
+            for fut in tqdm(as_completed(futures), total=len(futures), desc="Running"):
+                # Drop our references so the finished result can be freed once spooled
+                c = futures.pop(fut)
+                try:
+                    results.add(fut.result())
+                except Exception as e:
+                    results.add({
+                        "id": c["id"],
+                        "error": str(e),
+                        "request": c,
+                        "compare": {"equal": False},
+                    })
+
+        summary = {
+            "total": len(results),
+            "passed": results.passed,
+            "failed": results.failed,
+        }
+
+        # Write machine-readable results
+        with results_json_path.open("wb") as f:
+            f.write(b'{\n"summary": ' + dumps(summary, indent=True) + b',\n"results": [\n')
+            for i, raw in enumerate(results.iter_raw()):
+                if i:
+                    f.write(b",\n")
+                f.write(raw)
+            f.write(b'\n],\n"targets": ' + dumps(targets_info, indent=True) + b"\n}\n")
+
+        # Render HTML
+        render_html({"summary": summary, "results": iter(results), "targets": targets_info}, html_path)
 
     print(f"Report: {html_path}")
     print(f"JSON:   {results_json_path}")
@@ -218,8 +373,8 @@ def cmd_from_logs(args: argparse.Namespace) -> int:
     if args.max and args.max > 0:
         cases = cases[: args.max]
 
-    tmp_cases = artifacts / "testcases.json"
-    tmp_cases.write_text(json.dumps(cases, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp_cases = artifacts / "testcases.jsonl"
+    _write_testcases(tmp_cases, cases)
     # Reuse run flow
     class TmpArgs:
         testcases = str(tmp_cases)
@@ -232,16 +387,17 @@ def cmd_from_logs(args: argparse.Namespace) -> int:
 
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="compare-api", description="Compare API responses across two endpoints from log-derived testcases")
+    p.add_argument("--debug", action="store_true", help="Print debug details while extracting testcases")
     sub = p.add_subparsers(dest="command", required=True)
 
     p_extract = sub.add_parser("extract", help="Extract unique request patterns from logs")
     p_extract.add_argument("--logs", required=False, default=None, help="Path to JSON/JSONL logs (defaults to logs/requests.json[l] or examples)")
     p_extract.add_argument("--config", required=False, default=None, help="Path to config.yml (defaults: config.yml/config.yaml/examples/config.yml)")
-    p_extract.add_argument("--out", required=False, default="artifacts/testcases.json", help="Where to write extracted testcases")
+    p_extract.add_argument("--out", required=False, default="artifacts/testcases.jsonl", help="Where to write extracted testcases (JSON Lines)")
     p_extract.set_defaults(func=cmd_extract)
 
     p_run = sub.add_parser("run", help="Run testcases against two targets and generate a report")
-    p_run.add_argument("--testcases", required=False, default=None, help="Path to extracted testcases JSON (default: artifacts/testcases.json)")
+    p_run.add_argument("--testcases", required=False, default=None, help="Path to extracted testcases JSONL (default: artifacts/testcases.jsonl)")
     p_run.add_argument("--refresh-from-logs", action="store_true", help="Re-extract testcases from logs before running")
     p_run.add_argument("--logs", required=False, default=None, help="Path to JSON/JSONL logs when using --refresh-from-logs (defaults to logs/requests.json[l] or examples)")
     p_run.add_argument("--config", required=False, default=None, help="Path to config.yml (defaults: config.yml/config.yaml/examples/config.yml)")
@@ -262,6 +418,9 @@ def build_parser() -> argparse.ArgumentParser:
 def main(argv: List[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.debug:
+        logging.basicConfig(format="%(levelname)s: %(message)s")
+        logging.getLogger("compare_api").setLevel(logging.DEBUG)
     return args.func(args)
 
 
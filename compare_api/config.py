@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -71,21 +70,24 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "verify_tls": True,
         "retries": 1,
         "backoff_seconds": 0.2,
+        # Worker processes for JSON body diffs; 0 diffs in the request threads
+        "diff_processes": 0,
     },
 }
 
 
 def deep_merge_dicts(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    result = copy.deepcopy(base)
+    """Return ``base`` with ``override`` merged in, without mutating either.
+
+    Values are not copied: untouched nested dicts and override leaves are shared
+    with the inputs, so callers must treat the result as read-only.
+    """
+    result = {**base}
     for key, value in (override or {}).items():
-        if (
-            key in result
-            and isinstance(result[key], dict)
-            and isinstance(value, dict)
-        ):
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
             result[key] = deep_merge_dicts(result[key], value)
         else:
-            result[key] = copy.deepcopy(value)
+            result[key] = value
     return result
 
 
@@ -97,7 +99,7 @@ def load_config(path: Optional[str]) -> Dict[str, Any]:
                 path = candidate
                 break
     if path is None:
-        return copy.deepcopy(DEFAULT_CONFIG)
+        return deep_merge_dicts(DEFAULT_CONFIG, {})
 
     with open(path, "r", encoding="utf-8") as f:
         user_cfg = yaml.safe_load(f) or {}
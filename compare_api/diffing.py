@@ -1,90 +1,118 @@
 from __future__ import annotations
 
-import copy
 import json
-import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
 
 from deepdiff import DeepDiff
+from deepdiff.serialization import json_convertor_default
+from lxml import etree
+
+from ._json import dumps, loads
+
+
+def _parse_xml(xml_string: str, keep_comments: bool = False) -> etree._Element:
+    """Parse XML for normalization and pretty-printing.
+
+    Comments and processing instructions never take part in the comparison
+    and are only kept (``keep_comments``) for display. Not memoized itself:
+    repeated payloads are served by the size-bounded caches of the results.
+    """
+    parser = etree.XMLParser(
+        # The text is already decoded; ignore the declared encoding (EUC-KR,
+        # ISO-8859-1, ...) of the UTF-8 bytes handed to lxml
+        encoding="utf-8",
+        remove_blank_text=True,
+        remove_comments=not keep_comments,
+        remove_pis=not keep_comments,
+    )
+    return etree.fromstring(xml_string.encode("utf-8"), parser)
+
+
+# Normalized XML keyed by the raw string. Larger payloads are normalized
+# without memoization, and the combined size of cached inputs and outputs is
+# capped so many distinct bodies cannot grow the cache without bound.
+_XML_CACHE_MAX_CHARS = 1 << 20
+_XML_CACHE_TOTAL_CHARS = 32 << 20
+_xml_cache: "OrderedDict[str, str]" = OrderedDict()
+_xml_cache_chars = 0
+_xml_cache_lock = threading.Lock()
 
 
 def normalize_xml(xml_string: str) -> str:
     """
     Normalize XML string by parsing and reformatting with consistent structure.
     This helps compare XML responses that are functionally identical but formatted differently.
+    Results are memoized since regression suites often repeat the same payloads.
     """
+    if len(xml_string) > _XML_CACHE_MAX_CHARS:
+        return _normalize_xml(xml_string)
+    return _normalize_xml_cached(xml_string)
+
+
+def _uses_namespaces(root: etree._Element) -> bool:
+    # Only namespaced names are rewritten; unused declarations and "xmlns" in
+    # text or comments must not change the normalized form
+    return any(
+        el.tag.startswith("{") or any(k.startswith("{") for k in el.attrib)
+        for el in root.iter()
+        if isinstance(el.tag, str)
+    )
+
+
+def _normalize_xml(xml_string: str) -> str:
     try:
         # Remove leading/trailing whitespace
         xml_string = xml_string.strip()
         if not xml_string:
             return xml_string
-            
-        # Parse XML
-        root = ET.fromstring(xml_string)
-        
-        # Sort attributes for consistent ordering
-        def sort_attributes_and_normalize(elem):
-            # Sort attributes by key for consistent ordering
-            if elem.attrib:
-                sorted_attribs = sorted(elem.attrib.items())
-                elem.attrib.clear()
-                elem.attrib.update(sorted_attribs)
-            
-            # Process children recursively
-            for child in elem:
-                sort_attributes_and_normalize(child)
-            
-            # Normalize text content (strip whitespace but preserve content)
-            if elem.text:
-                elem.text = elem.text.strip() or None
-            if elem.tail:
-                elem.tail = elem.tail.strip() or None
-        
-        sort_attributes_and_normalize(root)
-        
-        # Convert back to string
-        xml_str = ET.tostring(root, encoding='unicode', method='xml')
-        
-        # Remove XML declaration if present and normalize
-        if xml_str.startswith('<?xml'):
-            xml_str = xml_str.split('?>', 1)[1]
-        
-        return xml_str.strip()
-        
-    except ET.ParseError:
-        # If it's not valid XML, return as-is
-        return xml_string
+
+        # Canonical XML 2.0 sorts attributes, drops the XML declaration and,
+        # with strip_text, trims whitespace around text content. Prefixes are
+        # rewritten so p:/q:/default bindings of the same URI compare equal.
+        root = _parse_xml(xml_string)
+        return etree.canonicalize(
+            root, with_comments=False, strip_text=True, rewrite_prefixes=_uses_namespaces(root)
+        )
+
     except Exception:
-        # For any other errors, return as-is
+        # If it's not valid XML, return as-is
         return xml_string
 
 
+def _normalize_xml_cached(xml_string: str) -> str:
+    global _xml_cache_chars
+    with _xml_cache_lock:
+        if xml_string in _xml_cache:
+            _xml_cache.move_to_end(xml_string)
+            return _xml_cache[xml_string]
+    normalized = _normalize_xml(xml_string)
+    with _xml_cache_lock:
+        if xml_string not in _xml_cache:
+            _xml_cache_chars += len(xml_string) + len(normalized)
+        _xml_cache[xml_string] = normalized
+        while _xml_cache_chars > _XML_CACHE_TOTAL_CHARS:
+            key, value = _xml_cache.popitem(last=False)
+            _xml_cache_chars -= len(key) + len(value)
+    return normalized
+
+
 def pretty_format_xml(xml_string: str) -> str:
     """
     Format XML string with proper indentation for display purposes.
     This makes XML more readable in the HTML report.
     """
     try:
-        import xml.dom.minidom
-        
         # Remove leading/trailing whitespace
-        xml_string = xml_string.strip()
-        if not xml_string:
-            return xml_string
-            
-        # Parse and pretty print
-        dom = xml.dom.minidom.parseString(xml_string)
-        pretty_xml = dom.toprettyxml(indent="  ", encoding=None)
-        
-        # Remove empty lines and the XML declaration if we don't want it
-        lines = [line for line in pretty_xml.split('\n') if line.strip()]
-        
-        # Remove XML declaration line if it exists
-        if lines and lines[0].startswith('<?xml'):
-            lines = lines[1:]
-            
-        return '\n'.join(lines)
-        
+        stripped = xml_string.strip()
+        if not stripped:
+            return stripped
+
+        # The whole document, so comments and PIs around the root stay too
+        root = _parse_xml(stripped, keep_comments=True)
+        return etree.tostring(root.getroottree(), encoding="unicode", pretty_print=True).rstrip("\n")
+
     except Exception:
         # If parsing fails, return original
         return xml_string
@@ -92,37 +120,62 @@ def pretty_format_xml(xml_string: str) -> str:
 
 def is_xml_content(content: str) -> bool:
     """Check if content appears to be XML based on basic patterns."""
-    if not isinstance(content, str):
+    if not isinstance(content, str) or not content:
+        return False
+    # Look at the first/last non-whitespace characters in place; strip() would
+    # copy a potentially multi-MB body just to inspect two characters
+    n = len(content)
+    i = 0
+    while i < n and content[i].isspace():
+        i += 1
+    if i == n or content[i] != '<':
         return False
-    content = content.strip()
-    return content.startswith('<') and content.endswith('>')
+    j = n - 1
+    while content[j].isspace():
+        j -= 1
+    return content[j] == '>'
+
+
+def normalize_headers(h: Dict[str, str], ignore: Iterable[str]) -> Dict[str, str]:
+    """Lower-case header names and drop ignored ones."""
+    return normalize_headers_lowered(h, frozenset(k.lower() for k in (ignore or [])))
 
 
-def normalize_headers(h: Dict[str, str], ignore: List[str]) -> Dict[str, str]:
-    ignore_set = {k.lower() for k in (ignore or [])}
+def normalize_headers_lowered(h: Dict[str, str], ignore_lowered: FrozenSet[str]) -> Dict[str, str]:
+    """Like ``normalize_headers`` with the ignored names already lower-cased."""
     result: Dict[str, str] = {}
     for k, v in (h or {}).items():
         lk = k.lower()
-        if lk in ignore_set:
+        if lk in ignore_lowered:
             continue
         result[lk] = v
     return result
 
 
 def compare_headers(
-    left: Dict[str, str], right: Dict[str, str], ignore: List[str]
+    left: Dict[str, str], right: Dict[str, str], ignore: Iterable[str]
 ) -> Dict[str, Any]:
-    l = normalize_headers(left, ignore)
-    r = normalize_headers(right, ignore)
-    keys = set(l) | set(r)
-    diffs: List[Dict[str, Any]] = []
-    for k in sorted(keys):
-        lv = l.get(k)
-        rv = r.get(k)
-        if lv != rv:
-            diffs.append({"key": k, "left": lv, "right": rv})
+    return compare_headers_lowered(left, right, frozenset(k.lower() for k in (ignore or [])))
+
+
+def compare_headers_lowered(
+    left: Dict[str, str], right: Dict[str, str], ignore_lowered: FrozenSet[str]
+) -> Dict[str, Any]:
+    """Like ``compare_headers`` with the ignored names already lower-cased.
+
+    Lets callers lower-case the ignore list once per run.
+    """
+    l = normalize_headers_lowered(left, ignore_lowered)
+    r = normalize_headers_lowered(right, ignore_lowered)
+    if l == r:
+        return {"equal": True, "diffs": [], "left": l, "right": r}
+    # Only the (few) differing keys are sorted, for a stable report order
+    diffs: List[Dict[str, Any]] = [
+        {"key": k, "left": l.get(k), "right": r.get(k)}
+        for k in sorted(k for k in l.keys() | r.keys() if l.get(k) != r.get(k))
+    ]
     return {
-        "equal": len(diffs) == 0,
+        "equal": False,
         "diffs": diffs,
         "left": l,
         "right": r,
@@ -133,38 +186,87 @@ def compare_status(left: int, right: int) -> Dict[str, Any]:
     return {"equal": left == right, "left": left, "right": right}
 
 
+def bodies_identical(left: Any, right: Any) -> bool:
+    """Cheap strict equality check for decoded JSON bodies.
+
+    Serialized forms are compared instead of ``left == right`` so that values
+    like ``1`` vs ``1.0`` or ``1`` vs ``true`` still reach DeepDiff and are
+    reported as type changes.
+    """
+    if left is right:
+        # Identical response bytes decode to the same shared object
+        return True
+    try:
+        return dumps(left, sort_keys=True) == dumps(right, sort_keys=True)
+    except (TypeError, ValueError):
+        return False
+
+
+def _text_form(value: Any) -> str:
+    """String form of a body for text/XML comparison."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return dumps(value).decode("utf-8")
+
+
+def diff_json_bodies(
+    left: Dict[str, Any] | List[Any],
+    right: Dict[str, Any] | List[Any],
+    ignore_paths: Iterable[str],
+) -> Dict[str, Any]:
+    """DeepDiff two decoded JSON bodies.
+
+    This is the CPU-heavy part of ``compare_bodies``; it is a top-level function
+    taking and returning plain data so it can also run in a worker process.
+    """
+    # DeepDiff does not mutate its inputs, so no defensive copies
+    diff = DeepDiff(
+        left,
+        right,
+        # DeepDiff copies and root-prefixes these itself on every call
+        exclude_paths=ignore_paths,
+        ignore_order=True,
+    )
+    equal = not bool(diff)
+    return {
+        "mode": "json",
+        "equal": equal,
+        "diff": _diff_to_json(diff) if diff else {},
+    }
+
+
+def _diff_to_json(diff: DeepDiff) -> Any:
+    # to_json() maps sets/types/Decimals to JSON types (via orjson when
+    # installed); parsing it back with orjson keeps the round trip in C
+    try:
+        return loads(diff.to_json())
+    except TypeError:
+        # orjson rejects integers beyond 64 bits and NaN from the stdlib
+        # parser; use DeepDiff's own stdlib path for those
+        return loads(json.dumps(diff.to_dict(), default=json_convertor_default()))
+
+
 def compare_bodies(
     left: Dict[str, Any] | str | None,
     right: Dict[str, Any] | str | None,
-    ignore_paths: List[str],
+    ignore_paths: Iterable[str],
 ) -> Dict[str, Any]:
     # Four modes:
     # - Both JSON-like (dict/list)
     # - Both XML-like strings
     # - Otherwise compare string forms
+    # Pretty-printed bodies are produced by the HTML report at render time.
     if isinstance(left, (dict, list)) and isinstance(right, (dict, list)):
-        # Deep copy to avoid mutating originals
-        l = copy.deepcopy(left)
-        r = copy.deepcopy(right)
-        diff = DeepDiff(
-            l,
-            r,
-            exclude_paths=set(ignore_paths or []),
-            ignore_order=True,
-            view="tree",
-        )
-        equal = not bool(diff)
-        return {
-            "mode": "json",
-            "equal": equal,
-            "diff": json.loads(diff.to_json()) if diff else {},
-            "left_pretty": json.dumps(l, indent=2, ensure_ascii=False, sort_keys=True),
-            "right_pretty": json.dumps(r, indent=2, ensure_ascii=False, sort_keys=True),
-        }
+        # Most cases pass; identical payloads need no DeepDiff walk at all
+        if bodies_identical(left, right):
+            return {"mode": "json", "equal": True, "diff": {}}
+        return diff_json_bodies(left, right, ignore_paths)
     else:
         # Convert to string representation
-        ls = "" if left is None else (left if isinstance(left, str) else json.dumps(left))
-        rs = "" if right is None else (right if isinstance(right, str) else json.dumps(right))
+        ls = _text_form(left)
+        rs = _text_form(right)
         
         # Check if both look like XML and normalize them for comparison
         if is_xml_content(ls) and is_xml_content(rs):
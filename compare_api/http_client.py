@@ -1,18 +1,50 @@
 from __future__ import annotations
 
+import hashlib
+import http.cookiejar
+import json
+import threading
 import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ._json import JSONDecodeError, dumps, loads
+
+
+@lru_cache(maxsize=8)
+def _prepared_base_url(base_url: str) -> str:
+    return base_url.rstrip("/") + "/"
 
 
 def _join_url(base_url: str, path: str) -> str:
-    if base_url.endswith("/") and path.startswith("/"):
-        return base_url[:-1] + path
-    if not base_url.endswith("/") and not path.startswith("/"):
-        return base_url + "/" + path
-    return base_url + path
+    return _prepared_base_url(base_url) + (path[1:] if path.startswith("/") else path)
+
+
+@lru_cache(maxsize=4096)
+def _encode_params(params: Tuple[Tuple[str, Any], ...]) -> str:
+    # Same encoding requests applies to a params list (None values are dropped)
+    return urlencode([(k, v) for k, v in params if v is not None])
+
+
+def _query_string(query: Dict[str, Any]) -> Any:
+    params = []
+    for k, v in (query or {}).items():
+        if isinstance(v, list):
+            for item in v:
+                params.append((k, item))
+        else:
+            params.append((k, v))
+    try:
+        return _encode_params(tuple(params))
+    except TypeError:
+        # Unhashable values; let requests encode them
+        return params
 
 
 HOP_BY_HOP = {
@@ -29,18 +61,112 @@ HOP_BY_HOP = {
 }
 
 
-def prepare_headers(base_headers: Dict[str, str], overrides: Dict[str, str]) -> Dict[str, str]:
+# Connection pool sizing shared by every per-target session; see configure_pools().
+_POOL_SETTINGS: Dict[str, Any] = {
+    "pool_size": 8,
+    "retries": 0,
+    "backoff_seconds": 0.0,
+}
+
+
+def configure_pools(cfg: Dict[str, Any]) -> None:
+    """Size the per-target connection pools from the ``execution`` config section.
+
+    Must be called before the first request; existing sessions are discarded.
+    """
+    exec_cfg = cfg.get("execution", {})
+    _POOL_SETTINGS["pool_size"] = max(1, int(exec_cfg.get("concurrency", 8)))
+    _POOL_SETTINGS["retries"] = max(0, int(exec_cfg.get("retries", 0) or 0))
+    _POOL_SETTINGS["backoff_seconds"] = float(exec_cfg.get("backoff_seconds", 0) or 0)
+    _session_for.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _session_for(base_url: str) -> requests.Session:
+    """Return a keep-alive session shared by all requests to ``base_url``."""
+    pool_size = _POOL_SETTINGS["pool_size"]
+    # pool_block caps open sockets per host at the pool size instead of
+    # opening (and then discarding) extra connections under load
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=True,
+        max_retries=Retry(
+            total=_POOL_SETTINGS["retries"],
+            backoff_factor=_POOL_SETTINGS["backoff_seconds"],
+            # Only connection failures are retried; a 413/429/503 response is
+            # what gets compared, not a second attempt after Retry-After
+            respect_retry_after_header=False,
+        ),
+    )
+    session = requests.Session()
+    # Shared across test cases for pooling only: never store Set-Cookie, so
+    # no case sends cookies picked up from another case's response
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def sanitize_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """Lower-case header names and drop hop-by-hop headers."""
     result: Dict[str, str] = {}
-    for k, v in (base_headers or {}).items():
+    for k, v in (headers or {}).items():
         lk = k.lower()
-        if lk in HOP_BY_HOP:
-            continue
-        result[lk] = v
-    for k, v in (overrides or {}).items():
-        result[k.lower()] = v
+        if lk not in HOP_BY_HOP:
+            result[lk] = v
     return result
 
 
+def prepare_headers(base_headers: Dict[str, str], overrides: Dict[str, str]) -> Dict[str, str]:
+    """Merge per-request headers over target defaults.
+
+    Both arguments must already be passed through ``sanitize_headers``.
+    """
+    return {**base_headers, **overrides}
+
+
+# Decoded JSON bodies keyed by a digest of the raw bytes. Many cases get the
+# same payload back (and left/right often match), so identical bytes are
+# parsed once. Cached objects are shared and must be treated as read-only.
+_JSON_CACHE_SIZE = 512
+_JSON_CACHE_MAX_BYTES = 1 << 20
+# Decoded objects take several times their source size, so the combined body
+# size is capped as well as the entry count
+_JSON_CACHE_TOTAL_BYTES = 32 << 20
+_json_cache: "OrderedDict[bytes, Tuple[Any, int]]" = OrderedDict()
+_json_cache_bytes = 0
+_json_cache_lock = threading.Lock()
+
+
+def _loads_body(content: bytes) -> Any:
+    try:
+        return loads(content)
+    except JSONDecodeError:
+        # Like resp.json(), also accept a BOM or a UTF-16/32 encoded body
+        return loads(content.decode(json.detect_encoding(content)))
+
+
+def _decode_json(content: bytes) -> Any:
+    global _json_cache_bytes
+    size = len(content)
+    if size > _JSON_CACHE_MAX_BYTES:
+        return _loads_body(content)
+    digest = hashlib.blake2b(content, digest_size=16).digest()
+    with _json_cache_lock:
+        if digest in _json_cache:
+            _json_cache.move_to_end(digest)
+            return _json_cache[digest][0]
+    value = _loads_body(content)
+    with _json_cache_lock:
+        if digest not in _json_cache:
+            _json_cache_bytes += size
+        _json_cache[digest] = (value, size)
+        while len(_json_cache) > _JSON_CACHE_SIZE or _json_cache_bytes > _JSON_CACHE_TOTAL_BYTES:
+            _json_cache_bytes -= _json_cache.popitem(last=False)[1][1]
+    return value
+
+
 def send_request(
     *,
     base_url: str,
@@ -53,39 +179,34 @@ def send_request(
     verify_tls: bool,
 ) -> Dict[str, Any]:
     url = _join_url(base_url, path)
-    params = []
-    for k, v in (query or {}).items():
-        if isinstance(v, list):
-            for item in v:
-                params.append((k, item))
-        else:
-            params.append((k, v))
+    params = _query_string(query)
 
     data = None
-    json_body = None
     if body is None:
         pass
     elif isinstance(body, (dict, list)):
-        json_body = body
+        # Serialize ourselves rather than via json=, which uses stdlib json
+        data = dumps(body)
+        if not any(k.lower() == "content-type" for k in headers):
+            headers = {**headers, "content-type": "application/json"}
     elif isinstance(body, (str, bytes)):
         data = body
     else:
         # best-effort: string cast
         data = str(body)
 
-    session = requests.Session()
-    start = time.perf_counter()
+    session = _session_for(base_url)
+    start = time.perf_counter_ns()
     resp = session.request(
         method=method.upper(),
         url=url,
         params=params,
         headers=headers,
         data=data,
-        json=json_body,
         timeout=timeout_seconds,
         verify=verify_tls,
     )
-    elapsed_ms = int((time.perf_counter() - start) * 1000)
+    elapsed_ms = (time.perf_counter_ns() - start) // 1_000_000
 
     # Normalize headers to lower-case keys, join multi-values
     norm_headers: Dict[str, str] = {}
@@ -97,7 +218,7 @@ def send_request(
     content_type = norm_headers.get("content-type", "")
     if "application/json" in content_type:
         try:
-            body_json = resp.json()
+            body_json = _decode_json(resp.content)
         except Exception:
             text = resp.text
     else:
@@ -1,33 +1,86 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 from urllib.parse import parse_qsl, urlparse
 
+from ._json import JSONDecodeError, dumps, loads
+
+logger = logging.getLogger(__name__)
+
+# Characters that change the object-splitting state outside/inside JSON strings
+_STRUCTURAL_RE = re.compile(r'[{}"]')
+_STRING_SPECIAL_RE = re.compile(r'["\\]')
+
+
+# Dotted mapping paths pre-split into their parts, e.g. (("request", "url"),)
+CompiledPaths = Tuple[Tuple[str, ...], ...]
+
+
+@lru_cache(maxsize=None)
+def _compile_paths(paths: Tuple[str, ...]) -> CompiledPaths:
+    # Support dotted paths like request.url
+    return tuple(tuple(path.split(".")) for path in paths)
+
 
 def _get_first(obj: Dict[str, Any], paths: List[str]) -> Any:
-    for path in paths:
-        # Support dotted paths like request.url
-        parts = path.split(".")
+    return _get_first_compiled(obj, _compile_paths(tuple(paths)))
+
+
+def _get_first_compiled(obj: Dict[str, Any], compiled_paths: CompiledPaths) -> Any:
+    for parts in compiled_paths:
         current: Any = obj
-        try:
-            for part in parts:
-                if current is None:
-                    break
-                if isinstance(current, dict):
-                    current = current.get(part)
-                else:
-                    current = None
-                    break
-            if current is not None and current != {}:  # Skip empty dicts too
-                return current
-        except AttributeError:
-            # Not a dict somewhere along the way
-            continue
+        for part in parts:
+            if not isinstance(current, dict):
+                # None or not a dict somewhere along the way
+                current = None
+                break
+            current = current.get(part)
+        if current is not None and current != {}:  # Skip empty dicts too
+            return current
     return None
 
 
+# Mapped log fields with their default paths, in _extract_fields order
+_MAPPED_FIELDS: Tuple[Tuple[str, List[str]], ...] = (
+    ("method", ["method"]),
+    ("url", ["url"]),
+    ("path", ["path"]),
+    ("headers", ["headers"]),
+    ("query", ["query", "request.query", "parameter"]),
+    ("body", ["body"]),
+)
+
+
+def _compile_mapping(mapping: Dict[str, Any]) -> Tuple[CompiledPaths, ...]:
+    return tuple(
+        _compile_paths(tuple(mapping.get(name, default))) for name, default in _MAPPED_FIELDS
+    )
+
+
+def _extract_fields(entry: Dict[str, Any], compiled_mapping: Tuple[CompiledPaths, ...]) -> Tuple[Any, ...]:
+    """Resolve method, url, path, headers, query and body of one log entry.
+
+    Missing method, headers and query fall back to ``"GET"``/``{}``.
+    """
+    method_paths, url_paths, path_paths, headers_paths, query_paths, body_paths = compiled_mapping
+    return (
+        _get_first_compiled(entry, method_paths) or "GET",
+        _get_first_compiled(entry, url_paths),
+        _get_first_compiled(entry, path_paths),
+        _get_first_compiled(entry, headers_paths) or {},
+        _get_first_compiled(entry, query_paths) or {},
+        _get_first_compiled(entry, body_paths),
+    )
+
+
 def _normalize_headers(headers: Optional[Dict[str, Any]]) -> Dict[str, str]:
     result: Dict[str, str] = {}
     if not headers:
@@ -35,11 +88,21 @@ def _normalize_headers(headers: Optional[Dict[str, Any]]) -> Dict[str, str]:
     for k, v in headers.items():
         if v is None:
             continue
-        result[str(k).lower()] = ",".join(v) if isinstance(v, list) else str(v)
+        # Exact type checks: log headers are almost always plain str values
+        key = k.lower() if type(k) is str else str(k).lower()
+        if type(v) is str:
+            result[key] = v
+        elif type(v) is list:
+            result[key] = ",".join(v)
+        else:
+            result[key] = str(v)
     return result
 
 
-def _parse_url(url: str) -> Tuple[str, Dict[str, Any]]:
+@lru_cache(maxsize=1 << 16)
+def _parse_url_cached(url: str) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+    # Access logs repeat the same URLs heavily; the result is immutable so it
+    # can be shared between entries
     parsed = urlparse(url)
     path = parsed.path or "/"
     query_items = parse_qsl(parsed.query, keep_blank_values=True)
@@ -53,7 +116,16 @@ def _parse_url(url: str) -> Tuple[str, Dict[str, Any]]:
                 query[k] = [existing, v]
         else:
             query[k] = v
-    return path, query
+    return path, tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in query.items())
+
+
+def _parse_url(url: str) -> Tuple[str, Dict[str, Any]]:
+    """Split ``url`` into its path and a new query dict.
+
+    Repeated parameters are collected into a tuple of values.
+    """
+    path, query_items = _parse_url_cached(url)
+    return path, dict(query_items)
 
 
 def _ensure_content_type_from_mime(
@@ -97,65 +169,93 @@ def _ensure_content_type_from_mime(
     return headers
 
 
+def _loads_lenient(raw: bytes | str) -> Any:
+    try:
+        return loads(raw)
+    except JSONDecodeError:
+        if not isinstance(raw, bytes):
+            raise
+        # Invalid UTF-8: drop the bad bytes as read_text(errors="ignore") did
+        return loads(raw.decode("utf-8", errors="ignore"))
+
+
+def _sniff_log_format(p: Path) -> str:
+    # Only read up to the first non-whitespace byte to pick json vs jsonl
+    with p.open("rb") as f:
+        while True:
+            block = f.read(1 << 16)
+            if not block:
+                return "jsonl"
+            block = block.lstrip()
+            if block:
+                return "json" if block.startswith(b"[") else "jsonl"
+
+
 def load_logs(path: str, fmt: str = "auto") -> List[Dict[str, Any]]:
     p = Path(path)
     data: List[Dict[str, Any]] = []
-    text = p.read_text(encoding="utf-8", errors="ignore")
     effective_fmt = fmt
     if fmt == "auto":
-        stripped = text.lstrip()
-        if stripped.startswith("["):
-            effective_fmt = "json"
-        else:
-            effective_fmt = "jsonl"
+        effective_fmt = _sniff_log_format(p)
     def _parse_by_object_chunks(source: str) -> List[Dict[str, Any]]:
         # Split concatenated or pretty-printed objects without enclosing array
         items: List[Dict[str, Any]] = []
+        items_append = items.append
         s = source
         i = 0
         n = len(s)
         depth = 0
         in_string = False
-        escape = False
         start_idx: Optional[int] = None
+        # Jump straight to the next structural character instead of stepping
+        # through every character in Python; plain runs are skipped in C
         while i < n:
-            ch = s[i]
             if in_string:
-                if escape:
-                    escape = False
-                elif ch == "\\":
-                    escape = True
-                elif ch == '"':
-                    in_string = False
+                m = _STRING_SPECIAL_RE.search(s, i)
+                if m is None:
+                    break
+                i = m.start()
+                if s[i] == "\\":
+                    # Skip the escaped character
+                    i += 2
+                    continue
+                in_string = False
             else:
+                m = _STRUCTURAL_RE.search(s, i)
+                if m is None:
+                    break
+                i = m.start()
+                ch = s[i]
                 if ch == '"':
                     in_string = True
                 elif ch == '{':
                     if depth == 0:
                         start_idx = i
                     depth += 1
-                elif ch == '}':
+                else:
                     depth -= 1
                     if depth == 0 and start_idx is not None:
                         chunk = s[start_idx : i + 1]
                         try:
-                            obj = json.loads(chunk)
+                            obj = _loads_lenient(chunk)
                             if isinstance(obj, dict):
-                                items.append(obj)
-                        except json.JSONDecodeError:
+                                items_append(obj)
+                        except JSONDecodeError:
                             pass
                         start_idx = None
             i += 1
         return items
 
     if effective_fmt == "json":
+        raw = p.read_bytes()
         try:
-            items = json.loads(text) or []
-        except json.JSONDecodeError:
+            items = _loads_lenient(raw) or []
+        except JSONDecodeError:
+            text = raw.decode("utf-8", errors="ignore")
             # Heuristic: file might be a multi-object list missing [ ]
             try:
-                items = json.loads("[" + text + "]")
-            except json.JSONDecodeError as e:
+                items = _loads_lenient("[" + text + "]")
+            except JSONDecodeError as e:
                 # Try chunk-based parsing of objects
                 objs = _parse_by_object_chunks(text)
                 if objs:
@@ -174,32 +274,36 @@ def load_logs(path: str, fmt: str = "auto") -> List[Dict[str, Any]]:
             raise ValueError("JSON logs must be an array, or a dict wrapping an array, or a single object")
         data = [x for x in items if isinstance(x, dict)]
     elif effective_fmt == "jsonl":
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-                if isinstance(obj, dict):
-                    data.append(obj)
-            except json.JSONDecodeError:
-                continue
+        # Stream line by line so only one line is held in memory at a time
+        with p.open("rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    obj = _loads_lenient(line)
+                    if isinstance(obj, dict):
+                        data.append(obj)
+                except JSONDecodeError:
+                    continue
         # Fallback: whole file might be a single pretty-printed JSON object/array
         if not data:
+            raw = p.read_bytes()
             # Fallback to whole content as JSON (object or array)
             try:
-                whole = json.loads(text)
+                whole = _loads_lenient(raw)
                 if isinstance(whole, dict):
                     data = [whole]
                 elif isinstance(whole, list):
                     data = [x for x in whole if isinstance(x, dict)]
-            except json.JSONDecodeError:
+            except JSONDecodeError:
+                text = raw.decode("utf-8", errors="ignore")
                 # Heuristic: multi-object list missing [ ]
                 try:
-                    whole_alt = json.loads("[" + text + "]")
+                    whole_alt = _loads_lenient("[" + text + "]")
                     if isinstance(whole_alt, list):
                         data = [x for x in whole_alt if isinstance(x, dict)]
-                except json.JSONDecodeError:
+                except JSONDecodeError:
                     # Finally, split by balanced object chunks
                     objs = _parse_by_object_chunks(text)
                     if objs:
@@ -209,8 +313,8 @@ def load_logs(path: str, fmt: str = "auto") -> List[Dict[str, Any]]:
     return data
 
 
-def filter_dict(d: Dict[str, Any], keys_to_remove: Iterable[str]) -> Dict[str, Any]:
-    remove = {k.lower() for k in keys_to_remove}
+def filter_dict_lowered(d: Dict[str, Any], remove: FrozenSet[str]) -> Dict[str, Any]:
+    """Drop keys whose lowercased name is in ``remove`` (already lowercased)."""
     result: Dict[str, Any] = {}
     for k, v in (d or {}).items():
         if k.lower() in remove:
@@ -219,15 +323,29 @@ def filter_dict(d: Dict[str, Any], keys_to_remove: Iterable[str]) -> Dict[str, A
     return result
 
 
-def normalize_query(query: Dict[str, Any]) -> Dict[str, Any]:
-    # Ensure simple JSON-serializable values
-    result: Dict[str, Any] = {}
-    for k, v in (query or {}).items():
-        if isinstance(v, (list, tuple)):
-            result[k] = list(v)
-        else:
-            result[k] = v
-    return result
+def _normalize_and_filter_query(query: Dict[str, Any], remove: FrozenSet[str]) -> Dict[str, Any]:
+    # Drop ignored params and turn multi-values into lists in a single pass
+    return {
+        k: list(v) if isinstance(v, (list, tuple)) else v
+        for k, v in (query or {}).items()
+        if k.lower() not in remove
+    }
+
+
+def _canon_value(value: Any) -> Any:
+    # Nested objects are rare in query params but must not depend on key order
+    if isinstance(value, dict):
+        return {k: _canon_value(value[k]) for k in sorted(value)}
+    if isinstance(value, (list, tuple)):
+        return tuple(_canon_value(v) for v in value)
+    return value
+
+
+def _canon_query(query: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Order-independent form of a query for signatures, cheaper than JSON."""
+    return tuple(
+        sorted((k, v if type(v) is str else _canon_value(v)) for k, v in (query or {}).items())
+    )
 
 
 def normalize_body(body: Any) -> Any:
@@ -262,26 +380,31 @@ def compute_signature(
     path: str,
     query: Dict[str, Any],
     body: Any,
-    cfg: Dict[str, Any],
-) -> str:
-    strategy = cfg.get("deduplication", {}).get("strategy", "method_path_query")
-    include_body_for = set(
-        (cfg.get("deduplication", {}).get("include_body_for", []) or [])
-    )
-    key_parts: List[str] = [method.upper(), path]
-    if strategy in ["method_path_query", "path_grouped"]:
-        from json import dumps
+    strategy: str,
+    include_body_for: FrozenSet[str],
+) -> bytes:
+    """Return a 16-byte digest identifying the request for deduplication.
 
-        normalized_query = normalize_query(query)
-        key_parts.append(dumps(normalized_query, sort_keys=True, ensure_ascii=False))
-    if method.upper() in include_body_for and body is not None:
+    ``strategy`` and ``include_body_for`` come from the ``deduplication``
+    config and are resolved once per extraction by the caller.
+    """
+    method_up = method.upper()
+    # Hash the parts instead of joining them so large bodies are not kept
+    # around in the dedup sets
+    h = hashlib.blake2b(digest_size=16)
+    h.update(method_up.encode())
+    h.update(b"|")
+    h.update(path.encode())
+    if strategy in ["method_path_query", "path_grouped"]:
+        h.update(b"|")
+        h.update(repr(_canon_query(query)).encode())
+    if method_up in include_body_for and body is not None:
+        h.update(b"|")
         try:
-            from json import dumps
-
-            key_parts.append(dumps(body, sort_keys=True, ensure_ascii=False))
+            h.update(dumps(body, sort_keys=True))
         except Exception:
-            key_parts.append(str(body))
-    return "|".join(key_parts)
+            h.update(str(body).encode())
+    return h.digest()
 
 
 def extract_testcases(
@@ -298,60 +421,115 @@ def extract_testcases(
         return _extract_standard_testcases(raw_logs, cfg)
 
 
-def _extract_standard_testcases(
-    raw_logs: List[Dict[str, Any]], cfg: Dict[str, Any]
-) -> List[Dict[str, Any]]:
-    """Extract test cases using the original deduplication strategy."""
-    mapping = cfg.get("log_input", {}).get("mapping", {})
-    req_ign = cfg.get("request_ignores", {})
-    
-    seen: set[str] = set()
-    cases: List[Dict[str, Any]] = []
+# Standard extraction fans out to worker processes above this many entries;
+# below it pickling the entries costs more than it saves
+_PARALLEL_EXTRACT_MIN_ENTRIES = 50_000
+
+
+def _process_chunk(
+    chunk: List[Dict[str, Any]],
+    mapping: Dict[str, Any],
+    headers_remove: FrozenSet[str],
+    query_remove: FrozenSet[str],
+    strategy: str,
+    include_body_for: FrozenSet[str],
+) -> List[Tuple[bytes, Dict[str, Any]]]:
+    """Turn log entries into ``(signature, case)`` pairs in log order.
 
-    for entry in raw_logs:
-        method = _get_first(entry, mapping.get("method", ["method"])) or "GET"
-        url = _get_first(entry, mapping.get("url", ["url"]))
-        path = _get_first(entry, mapping.get("path", ["path"]))
-        headers = _get_first(entry, mapping.get("headers", ["headers"])) or {}
+    Only the first occurrence of a signature within ``chunk`` is kept. Kept at
+    module level so it can run in worker processes.
+    """
+    compiled_mapping = _compile_mapping(mapping)
+    seen: set[bytes] = set()
+    pairs: List[Tuple[bytes, Dict[str, Any]]] = []
+
+    for entry in chunk:
+        method, url, path, headers, query, body = _extract_fields(entry, compiled_mapping)
         headers = _ensure_content_type_from_mime(entry, headers, mapping)
-        query = _get_first(entry, mapping.get("query", ["query", "request.query", "parameter"])) or {}
-        body = _get_first(entry, mapping.get("body", ["body"]))
         body = normalize_body(body)
 
         if url and not path:
             path_from_url, query_from_url = _parse_url(url)
             path = path_from_url
-            # query merge: explicit query takes precedence
-            merged_query = {**query_from_url, **(query or {})}
-            query = merged_query
+            # query merge: explicit query takes precedence; the parsed dict
+            # is fresh per call so it can be updated in place
+            if query:
+                query_from_url.update(query)
+            query = query_from_url
         if not path:
             # cannot form request target
             continue
 
         norm_headers = _normalize_headers(headers)
-        norm_headers = filter_dict(norm_headers, req_ign.get("headers", []))
+        norm_headers = filter_dict_lowered(norm_headers, headers_remove)
 
         # Filter query params
-        query = normalize_query(query)
-        query = filter_dict(query, req_ign.get("query_params", []))
+        query = _normalize_and_filter_query(query, query_remove)
 
-        sig = compute_signature(method, path, query, body, cfg)
+        method_up = method.upper()
+        sig = compute_signature(method_up, path, query, body, strategy, include_body_for)
         if sig in seen:
             continue
         seen.add(sig)
 
-        cases.append(
-            {
-                "method": method.upper(),
-                "path": path,
-                "query": query,
-                "headers": norm_headers,
-                "body": body,
-            }
+        pairs.append(
+            (
+                sig,
+                {
+                    "method": method_up,
+                    "path": path,
+                    "query": query,
+                    "headers": norm_headers,
+                    "body": body,
+                },
+            )
         )
+    return pairs
+
+
+def _extract_standard_testcases(
+    raw_logs: List[Dict[str, Any]], cfg: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Extract test cases using the original deduplication strategy."""
+    mapping = cfg.get("log_input", {}).get("mapping", {})
+    req_ign = cfg.get("request_ignores", {})
+    headers_remove = frozenset(k.lower() for k in req_ign.get("headers", []))
+    query_remove = frozenset(k.lower() for k in req_ign.get("query_params", []))
+    dedup_cfg = cfg.get("deduplication", {})
+    strategy = dedup_cfg.get("strategy", "method_path_query")
+    include_body_for = frozenset(dedup_cfg.get("include_body_for", []) or [])
+    process_chunk = partial(
+        _process_chunk,
+        mapping=mapping,
+        headers_remove=headers_remove,
+        query_remove=query_remove,
+        strategy=strategy,
+        include_body_for=include_body_for,
+    )
+
+    workers = os.cpu_count() or 1
+    if len(raw_logs) > _PARALLEL_EXTRACT_MIN_ENTRIES and workers > 1:
+        # A few chunks per worker keeps them busy when entries vary in size;
+        # map() yields the chunks back in log order
+        size = -(-len(raw_logs) // (workers * 4))
+        chunks = [raw_logs[i : i + size] for i in range(0, len(raw_logs), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunk_pairs = list(pool.map(process_chunk, chunks))
+    else:
+        chunk_pairs = [process_chunk(raw_logs)]
+
+    # Merge serially so the first occurrence across chunks wins, as before
+    seen: set[bytes] = set()
+    cases: List[Dict[str, Any]] = []
+    for pairs in chunk_pairs:
+        for sig, case in pairs:
+            if sig in seen:
+                continue
+            seen.add(sig)
+            cases.append(case)
 
     # Stable order helps deterministic runs
-    cases.sort(key=lambda c: (c["method"], c["path"]))
+    cases.sort(key=itemgetter("method", "path"))
     # Assign IDs
     for idx, c in enumerate(cases, start=1):
         c["id"] = idx
@@ -364,70 +542,81 @@ def _extract_path_grouped_testcases(
     """Extract test cases grouped by path, with detailed parameter combinations within each path."""
     mapping = cfg.get("log_input", {}).get("mapping", {})
     req_ign = cfg.get("request_ignores", {})
-    
-    print(f"DEBUG: Processing {len(raw_logs)} log entries")
-    print(f"DEBUG: Mapping config: {mapping}")
+    # Split the mapping paths once instead of per entry
+    compiled_mapping = _compile_mapping(mapping)
+    headers_remove = frozenset(k.lower() for k in req_ign.get("headers", []))
+    query_remove = frozenset(k.lower() for k in req_ign.get("query_params", []))
+    dedup_cfg = cfg.get("deduplication", {})
+    strategy = dedup_cfg.get("strategy", "method_path_query")
+    include_body_for = frozenset(dedup_cfg.get("include_body_for", []) or [])
+    # Checked once so the per-entry messages cost nothing when disabled
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    logger.debug("Processing %d log entries", len(raw_logs))
+    logger.debug("Mapping config: %s", mapping)
     
     # Group by path first
     path_groups: Dict[str, List[Dict[str, Any]]] = {}
+    # Request keys already grouped under each path
+    path_seen: Dict[str, set[bytes]] = {}
     
     for i, entry in enumerate(raw_logs):
-        method = _get_first(entry, mapping.get("method", ["method"])) or "GET"
-        url = _get_first(entry, mapping.get("url", ["url"]))
-        path = _get_first(entry, mapping.get("path", ["path"]))
-        headers = _get_first(entry, mapping.get("headers", ["headers"])) or {}
+        method, url, path, headers, query, body = _extract_fields(entry, compiled_mapping)
         headers = _ensure_content_type_from_mime(entry, headers, mapping)
-        query = _get_first(entry, mapping.get("query", ["query", "request.query", "parameter"])) or {}
-        body = _get_first(entry, mapping.get("body", ["body"]))
         body = normalize_body(body)
 
-        print(f"DEBUG: Entry {i}: method={method}, path={path}, query={query}")
+        if debug:
+            logger.debug("Entry %d: method=%s, path=%s, query=%s", i, method, path, query)
 
         if url and not path:
             path_from_url, query_from_url = _parse_url(url)
             path = path_from_url
-            # query merge: explicit query takes precedence
-            merged_query = {**query_from_url, **(query or {})}
-            query = merged_query
+            # query merge: explicit query takes precedence; the parsed dict
+            # is fresh per call so it can be updated in place
+            if query:
+                query_from_url.update(query)
+            query = query_from_url
         if not path:
             # cannot form request target
             continue
 
         norm_headers = _normalize_headers(headers)
-        norm_headers = filter_dict(norm_headers, req_ign.get("headers", []))
+        norm_headers = filter_dict_lowered(norm_headers, headers_remove)
 
         # Filter query params
-        query = normalize_query(query)
-        query = filter_dict(query, req_ign.get("query_params", []))
+        query = _normalize_and_filter_query(query, query_remove)
 
-        print(f"DEBUG: After filtering: query={query}")
+        if debug:
+            logger.debug("After filtering: query=%s", query)
 
         # Create a unique key for this specific request within the path
-        request_key = compute_signature(method, path, query, body, cfg)
+        method_up = method.upper()
+        request_key = compute_signature(method_up, path, query, body, strategy, include_body_for)
         
-        print(f"DEBUG: Request key: {request_key}")
-        
-        if path not in path_groups:
-            path_groups[path] = []
+        if debug:
+            logger.debug("Request key: %s", request_key.hex())
         
         # Check if this exact request already exists in this path group
-        existing_keys = {req["request_key"] for req in path_groups[path]}
-        if request_key not in existing_keys:
-            path_groups[path].append({
-                "method": method.upper(),
+        seen_for_path = path_seen.setdefault(path, set())
+        if request_key not in seen_for_path:
+            seen_for_path.add(request_key)
+            path_groups.setdefault(path, []).append({
+                "method": method_up,
                 "path": path,
                 "query": query,
                 "headers": norm_headers,
                 "body": body,
                 "request_key": request_key,
             })
-            print(f"DEBUG: Added to path group {path}")
-        else:
-            print(f"DEBUG: Skipped duplicate request key: {request_key}")
-
-    print(f"DEBUG: Final path groups: {list(path_groups.keys())}")
-    for path, cases in path_groups.items():
-        print(f"DEBUG: Path {path} has {len(cases)} cases")
+            if debug:
+                logger.debug("Added to path group %s", path)
+        elif debug:
+            logger.debug("Skipped duplicate request key: %s", request_key.hex())
+
+    if debug:
+        logger.debug("Final path groups: %s", list(path_groups.keys()))
+        for path, cases in path_groups.items():
+            logger.debug("Path %s has %d cases", path, len(cases))
 
     # Convert to test cases with hierarchical structure
     cases: List[Dict[str, Any]] = []
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 
+from ._json import dumps
 from .diffing import is_xml_content, pretty_format_xml
 
 
@@ -13,28 +14,56 @@ def _templates_dir() -> Path:
     return Path(__file__).parent / "templates"
 
 
+# Bodies up to this size are memoized; the report shows most of them twice.
+_FORMAT_CACHE_MAX_CHARS = 1 << 20
+
+_pretty_format_xml_cached = lru_cache(maxsize=256)(pretty_format_xml)
+
+
 def format_xml_if_applicable(content: str) -> str:
     """Jinja2 filter to format XML content if it's XML, otherwise return as-is."""
-    if isinstance(content, str) and is_xml_content(content):
-        return pretty_format_xml(content)
-    return content
+    # Most bodies are JSON or plain text and return here
+    if not isinstance(content, str) or not content or not is_xml_content(content):
+        return content
+    if len(content) <= _FORMAT_CACHE_MAX_CHARS:
+        return _pretty_format_xml_cached(content)
+    return pretty_format_xml(content)
 
 
-def render_html(results: Dict[str, Any], out_path: str | Path) -> Path:
+def pretty_json(value: Any) -> str:
+    """Jinja2 filter to pretty-print a decoded JSON body for display.
+
+    Only rendered for failing JSON comparisons.
+    """
+    return dumps(value, indent=True, sort_keys=True).decode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _get_template() -> Template:
+    # Parsed once per process; templates ship with the package so there is
+    # nothing to reload between renders
     env = Environment(
         loader=FileSystemLoader(str(_templates_dir())),
         autoescape=select_autoescape(["html", "xml"]),
         trim_blocks=True,
         lstrip_blocks=True,
+        auto_reload=False,
     )
     
     # Add custom filter for XML formatting
     env.filters['format_xml'] = format_xml_if_applicable
+    env.filters['pretty_json'] = pretty_json
     
-    template = env.get_template("report.html.j2")
-    html = template.render(**results)
+    return env.get_template("report.html.j2")
+
+
+def render_html(results: Dict[str, Any], out_path: str | Path) -> Path:
+    template = _get_template()
     out = Path(out_path)
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(html, encoding="utf-8")
+    # Stream to disk instead of building the whole report in memory; buffered
+    # so each write and encode covers a batch of template events
+    stream = template.stream(**results)
+    stream.enable_buffering(size=64)
+    stream.dump(str(out), encoding="utf-8")
     return out
-